@@ -2,10 +2,10 @@ import logging
 
 from fastapi import APIRouter, Depends, Request, status
 from pydantic import BaseModel, EmailStr
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.api.service import auth_service
-from app.database.session import get_db
+from app.database.session import DbSession, get_db, run_db
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -38,9 +38,10 @@ class RefreshIn(BaseModel):
 
 
 @router.post("/auth/request-otp", response_model=RequestOtpOut, status_code=status.HTTP_202_ACCEPTED)
-def request_otp(payload: RequestOtpIn, db: Session = Depends(get_db)) -> RequestOtpOut:
+async def request_otp(payload: RequestOtpIn, db: DbSession = Depends(get_db)) -> RequestOtpOut:
     logger.info("auth.request_otp email=%s", payload.email)
-    debug_otp = auth_service.request_otp(db, str(payload.email))
+    normalized_email, otp_code = await run_db(db, auth_service.issue_otp, str(payload.email))
+    debug_otp = await run_in_threadpool(auth_service.deliver_otp, normalized_email, otp_code)
     return RequestOtpOut(
         status="accepted",
         message="If the email exists, an OTP will be sent.",
@@ -49,9 +50,10 @@ def request_otp(payload: RequestOtpIn, db: Session = Depends(get_db)) -> Request
 
 
 @router.post("/auth/verify-otp", response_model=TokenOut)
-def verify_otp(payload: VerifyOtpIn, request: Request, db: Session = Depends(get_db)) -> TokenOut:
-    data = auth_service.verify_otp_and_issue_tokens(
+async def verify_otp(payload: VerifyOtpIn, request: Request, db: DbSession = Depends(get_db)) -> TokenOut:
+    data = await run_db(
         db,
+        auth_service.verify_otp_and_issue_tokens,
         email=str(payload.email),
         otp_code=payload.otp,
         user_agent=request.headers.get("user-agent"),
@@ -62,9 +64,10 @@ def verify_otp(payload: VerifyOtpIn, request: Request, db: Session = Depends(get
 
 
 @router.post("/auth/refresh", response_model=TokenOut)
-def refresh(payload: RefreshIn, request: Request, db: Session = Depends(get_db)) -> TokenOut:
-    data = auth_service.refresh_tokens(
+async def refresh(payload: RefreshIn, request: Request, db: DbSession = Depends(get_db)) -> TokenOut:
+    data = await run_db(
         db,
+        auth_service.refresh_tokens,
         refresh_token=payload.refresh_token,
         user_agent=request.headers.get("user-agent"),
         ip_address=request.client.host if request.client else None,
@@ -74,7 +77,7 @@ def refresh(payload: RefreshIn, request: Request, db: Session = Depends(get_db))
 
 
 @router.post("/auth/logout", status_code=status.HTTP_204_NO_CONTENT)
-def logout(payload: RefreshIn, db: Session = Depends(get_db)) -> None:
-    auth_service.revoke_refresh_token(db, payload.refresh_token)
+async def logout(payload: RefreshIn, db: DbSession = Depends(get_db)) -> None:
+    await run_db(db, auth_service.revoke_refresh_token, payload.refresh_token)
     logger.info("auth.logout")
     return None
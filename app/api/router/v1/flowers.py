@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import base64
 from datetime import UTC, datetime
+import json
 import logging
 import secrets
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session, selectinload
 
 from app.database.models.flower import (
@@ -19,13 +21,15 @@ from app.database.models.flower import (
 )
 from app.database.models.user import User
 from app.config import get_settings
-from app.database.session import get_db
+from app.database.session import DbSession, get_db, run_db
 from app.security.auth import require_current_user
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 READY_WATER_COUNT = 7
+FLOWER_PAGE_DEFAULT_LIMIT = 20
+FLOWER_PAGE_MAX_LIMIT = 100
 
 
 def _utcnow() -> datetime:
@@ -46,6 +50,20 @@ def _get_stage_for_water_count(water_count: int) -> int:
     return 0
 
 
+def _encode_cursor(created_at: datetime, flower_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), flower_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, flower_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(flower_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
 def _get_owned_flower_or_404(db: Session, user_id: int, flower_id: int) -> Flower:
     flower = db.execute(
         select(Flower)
@@ -79,6 +97,11 @@ class FlowerOut(BaseModel):
     created_at: datetime
 
 
+class FlowerPageOut(BaseModel):
+    items: list[FlowerOut]
+    next_cursor: str | None
+
+
 class FlowerWaterIn(BaseModel):
     message: str = Field(min_length=1, max_length=2000)
     drop_type: str = Field(default=DropType.text.value, min_length=1, max_length=16)
@@ -137,51 +160,77 @@ class FlowerDetailOut(BaseModel):
     sent_at: datetime | None
 
 
-@router.post("/flowers", response_model=FlowerOut, status_code=status.HTTP_201_CREATED)
-def create_flower(
-    payload: FlowerCreateIn,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_current_user),
-) -> FlowerOut:
+def _create_flower(db: Session, user_id: int, payload: FlowerCreateIn) -> FlowerOut:
     flower = Flower(
-        owner_id=current_user.id,
+        owner_id=user_id,
         title=payload.title.strip(),
         flower_type=payload.flower_type.strip().lower(),
     )
     db.add(flower)
     db.commit()
     db.refresh(flower)
-    logger.info("flowers.create user_id=%s flower_id=%s", current_user.id, flower.id)
+    logger.info("flowers.create user_id=%s flower_id=%s", user_id, flower.id)
     return FlowerOut.model_validate(flower)
 
 
-@router.get("/flowers", response_model=list[FlowerOut])
-def list_flowers(
-    db: Session = Depends(get_db),
+@router.post("/flowers", response_model=FlowerOut, status_code=status.HTTP_201_CREATED)
+async def create_flower(
+    payload: FlowerCreateIn,
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(require_current_user),
-) -> list[FlowerOut]:
-    flowers = db.execute(
-        select(Flower).where(Flower.owner_id == current_user.id).order_by(Flower.created_at.desc(), Flower.id.desc())
-    ).scalars()
-    return [FlowerOut.model_validate(flower) for flower in flowers]
+) -> FlowerOut:
+    return await run_db(db, _create_flower, current_user.id, payload)
+
+
+def _list_flowers(
+    db: Session,
+    user_id: int,
+    limit: int,
+    cursor: str | None,
+    status_filter: FlowerStatus | None,
+) -> FlowerPageOut:
+    # Keyset pagination: each page is one range scan of (owner_id, created_at, id).
+    query = select(Flower).where(Flower.owner_id == user_id)
+    if status_filter is not None:
+        query = query.where(Flower.status == status_filter.value)
+    if cursor is not None:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(tuple_(Flower.created_at, Flower.id) < tuple_(cursor_created_at, cursor_id))
+    query = query.order_by(Flower.created_at.desc(), Flower.id.desc()).limit(limit + 1)
+
+    flowers = list(db.execute(query).scalars())
+    next_cursor = None
+    if len(flowers) > limit:
+        flowers = flowers[:limit]
+        next_cursor = _encode_cursor(flowers[-1].created_at, flowers[-1].id)
+    return FlowerPageOut(
+        items=[FlowerOut.model_validate(flower) for flower in flowers],
+        next_cursor=next_cursor,
+    )
 
 
-@router.get("/flowers/{flower_id}", response_model=FlowerDetailOut)
-def get_flower(
-    flower_id: int,
-    db: Session = Depends(get_db),
+@router.get("/flowers", response_model=FlowerPageOut)
+async def list_flowers(
+    limit: int = Query(default=FLOWER_PAGE_DEFAULT_LIMIT, ge=1, le=FLOWER_PAGE_MAX_LIMIT),
+    cursor: str | None = Query(default=None, max_length=200),
+    status_filter: FlowerStatus | None = Query(default=None, alias="status"),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(require_current_user),
-) -> FlowerDetailOut:
+) -> FlowerPageOut:
+    return await run_db(db, _list_flowers, current_user.id, limit, cursor, status_filter)
+
+
+def _get_flower(db: Session, user_id: int, flower_id: int) -> FlowerDetailOut:
     flower = db.execute(
         select(Flower)
         .where(Flower.id == flower_id)
-        .where(Flower.owner_id == current_user.id)
+        .where(Flower.owner_id == user_id)
         .options(selectinload(Flower.delivery))
     ).scalar_one_or_none()
     if not flower:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Flower not found")
 
-    logger.info("flowers.detail user_id=%s flower_id=%s", current_user.id, flower.id)
+    logger.info("flowers.detail user_id=%s flower_id=%s", user_id, flower.id)
     return FlowerDetailOut(
         flower=FlowerOut.model_validate(flower),
         share_token=flower.delivery.share_token if flower.delivery else None,
@@ -192,14 +241,17 @@ def get_flower(
     )
 
 
-@router.post("/flowers/{flower_id}/water", response_model=FlowerWaterOut)
-def water_flower(
+@router.get("/flowers/{flower_id}", response_model=FlowerDetailOut)
+async def get_flower(
     flower_id: int,
-    payload: FlowerWaterIn,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(require_current_user),
-) -> FlowerWaterOut:
-    flower = _get_owned_flower_or_404(db, current_user.id, flower_id)
+) -> FlowerDetailOut:
+    return await run_db(db, _get_flower, current_user.id, flower_id)
+
+
+def _water_flower(db: Session, user_id: int, flower_id: int, payload: FlowerWaterIn) -> FlowerWaterOut:
+    flower = _get_owned_flower_or_404(db, user_id, flower_id)
 
     if flower.status == FlowerStatus.sent.value:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Flower already sent")
@@ -245,7 +297,7 @@ def water_flower(
     db.commit()
     db.refresh(flower)
     db.refresh(drop)
-    logger.info("flowers.water user_id=%s flower_id=%s day=%s", current_user.id, flower.id, drop.day_number)
+    logger.info("flowers.water user_id=%s flower_id=%s day=%s", user_id, flower.id, drop.day_number)
 
     return FlowerWaterOut(
         flower=FlowerOut.model_validate(flower),
@@ -254,14 +306,18 @@ def water_flower(
     )
 
 
-@router.post("/flowers/{flower_id}/send", response_model=FlowerSendOut)
-def send_flower(
+@router.post("/flowers/{flower_id}/water", response_model=FlowerWaterOut)
+async def water_flower(
     flower_id: int,
-    payload: FlowerSendIn,
-    db: Session = Depends(get_db),
+    payload: FlowerWaterIn,
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(require_current_user),
-) -> FlowerSendOut:
-    flower = _get_owned_flower_or_404(db, current_user.id, flower_id)
+) -> FlowerWaterOut:
+    return await run_db(db, _water_flower, current_user.id, flower_id, payload)
+
+
+def _send_flower(db: Session, user_id: int, flower_id: int, payload: FlowerSendIn) -> FlowerSendOut:
+    flower = _get_owned_flower_or_404(db, user_id, flower_id)
 
     if flower.delivery:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Flower already has a delivery")
@@ -303,7 +359,7 @@ def send_flower(
         flower.sent_at = now
 
     db.commit()
-    logger.info("flowers.send user_id=%s flower_id=%s mode=%s", current_user.id, flower.id, mode)
+    logger.info("flowers.send user_id=%s flower_id=%s mode=%s", user_id, flower.id, mode)
 
     return FlowerSendOut(
         flower_id=flower.id,
@@ -314,17 +370,18 @@ def send_flower(
     )
 
 
-@router.post("/flowers/{flower_id}/dev/force-ready", response_model=FlowerOut)
-def force_ready_flower_dev(
+@router.post("/flowers/{flower_id}/send", response_model=FlowerSendOut)
+async def send_flower(
     flower_id: int,
-    db: Session = Depends(get_db),
+    payload: FlowerSendIn,
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(require_current_user),
-) -> FlowerOut:
-    settings = get_settings()
-    if settings.environment == "production":
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+) -> FlowerSendOut:
+    return await run_db(db, _send_flower, current_user.id, flower_id, payload)
+
 
-    flower = _get_owned_flower_or_404(db, current_user.id, flower_id)
+def _force_ready_flower(db: Session, user_id: int, flower_id: int) -> FlowerOut:
+    flower = _get_owned_flower_or_404(db, user_id, flower_id)
 
     # Dev convenience: allow resetting sent flowers into testable "ready" state.
     if flower.delivery:
@@ -338,12 +395,24 @@ def force_ready_flower_dev(
 
     db.commit()
     db.refresh(flower)
-    logger.info("flowers.dev.force_ready user_id=%s flower_id=%s", current_user.id, flower.id)
+    logger.info("flowers.dev.force_ready user_id=%s flower_id=%s", user_id, flower.id)
     return FlowerOut.model_validate(flower)
 
 
-@router.get("/flowers/open/{share_token}", response_model=FlowerOpenOut)
-def open_flower(share_token: str, db: Session = Depends(get_db)) -> FlowerOpenOut:
+@router.post("/flowers/{flower_id}/dev/force-ready", response_model=FlowerOut)
+async def force_ready_flower_dev(
+    flower_id: int,
+    db: DbSession = Depends(get_db),
+    current_user: User = Depends(require_current_user),
+) -> FlowerOut:
+    settings = get_settings()
+    if settings.environment == "production":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    return await run_db(db, _force_ready_flower, current_user.id, flower_id)
+
+
+def _open_flower(db: Session, share_token: str) -> FlowerOpenOut:
     delivery = db.execute(
         select(FlowerDelivery)
         .where(FlowerDelivery.share_token == share_token)
@@ -392,3 +461,8 @@ def open_flower(share_token: str, db: Session = Depends(get_db)) -> FlowerOpenOu
             for drop in ordered_drops
         ],
     )
+
+
+@router.get("/flowers/open/{share_token}", response_model=FlowerOpenOut)
+async def open_flower(share_token: str, db: DbSession = Depends(get_db)) -> FlowerOpenOut:
+    return await run_db(db, _open_flower, share_token)
@@ -7,7 +7,7 @@ router = APIRouter()
 
 
 @router.get("/me")
-def me(current_user: User = Depends(require_current_user)) -> dict[str, str | int | None]:
+async def me(current_user: User = Depends(require_current_user)) -> dict[str, str | int | None]:
     return {
         "id": current_user.id,
         "email": current_user.email,
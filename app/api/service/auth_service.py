@@ -71,7 +71,8 @@ def _make_refresh_token(user_id: int) -> tuple[str, str, datetime]:
     return token, jti, exp
 
 
-def request_otp(db: Session, email: str) -> str | None:
+def issue_otp(db: Session, email: str) -> tuple[str, str]:
+    """Persist a fresh OTP and return `(normalized_email, otp_code)` for delivery."""
     settings = get_settings()
     normalized_email = _normalize_email(email)
     otp_code = "".join(secrets.choice("0123456789") for _ in range(settings.auth_otp_length))
@@ -84,7 +85,12 @@ def request_otp(db: Session, email: str) -> str | None:
     )
     db.add(entry)
     db.commit()
+    return normalized_email, otp_code
+
 
+def deliver_otp(normalized_email: str, otp_code: str) -> str | None:
+    """Email the OTP; blocking network I/O, so keep it off the event loop and out of DB sessions."""
+    settings = get_settings()
     if settings.resend_api_key and settings.email_from:
         try:
             send_otp_email(
@@ -112,6 +118,11 @@ def request_otp(db: Session, email: str) -> str | None:
     return None
 
 
+def request_otp(db: Session, email: str) -> str | None:
+    normalized_email, otp_code = issue_otp(db, email)
+    return deliver_otp(normalized_email, otp_code)
+
+
 def _find_valid_otp(db: Session, email: str, otp_code: str) -> OtpCode | None:
     normalized_email = _normalize_email(email)
     otp_hash = _hash_otp(normalized_email, otp_code)
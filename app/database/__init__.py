@@ -1,4 +1,4 @@
 from app.database.base import Base
-from app.database.session import SessionLocal, engine, get_db
+from app.database.session import SessionLocal, engine, get_db, run_db
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db"]
+__all__ = ["Base", "SessionLocal", "engine", "get_db", "run_db"]
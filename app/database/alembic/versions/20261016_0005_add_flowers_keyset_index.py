@@ -0,0 +1,30 @@
+"""add flowers keyset pagination index
+
+Revision ID: 20261016_0005
+Revises: 20260225_0004
+Create Date: 2026-10-16 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_0005"
+down_revision: str | None = "20260225_0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # GET /flowers pages by (created_at, id) within one owner; one range scan per page.
+    op.create_index(
+        "ix_flowers_owner_id_created_at_id",
+        "flowers",
+        ["owner_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_flowers_owner_id_created_at_id", table_name="flowers")
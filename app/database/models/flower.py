@@ -13,6 +13,7 @@ from sqlalchemy import (
     func,
     text,
 )
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.base import Base
@@ -39,7 +40,10 @@ class DeliveryMode(str, enum.Enum):
 
 class Flower(Base):
     __tablename__ = "flowers"
-    __table_args__ = (Index("ix_flowers_owner_id_status", "owner_id", "status"),)
+    __table_args__ = (
+        Index("ix_flowers_owner_id_status", "owner_id", "status"),
+        Index("ix_flowers_owner_id_created_at_id", "owner_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -52,7 +56,12 @@ class Flower(Base):
     last_watered_on: Mapped[date | None] = mapped_column(Date())
     ready_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # SQLite's CURRENT_TIMESTAMP has second precision; bind cursor values the same way so
+    # keyset comparisons on (created_at, id) see equal timestamps as equal.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True).with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        server_default=func.now(),
+    )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
@@ -1,10 +1,22 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable
+from typing import Any, TypeVar
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.config import get_settings
-from app.database.url import normalize_database_url
+from app.database.url import normalize_database_url, to_async_database_url
+
+T = TypeVar("T")
+
+DbSession = Session | AsyncSession
 
 settings = get_settings()
 database_url = normalize_database_url(settings.database_url)
@@ -12,10 +24,38 @@ database_url = normalize_database_url(settings.database_url)
 engine = create_engine(database_url, echo=settings.sqlalchemy_echo, future=True, pool_pre_ping=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
 
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+if settings.database_async:
+    async_engine = create_async_engine(
+        to_async_database_url(settings.database_url),
+        echo=settings.sqlalchemy_echo,
+        pool_pre_ping=True,
+    )
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, class_=AsyncSession)
+
+
+async def get_db() -> AsyncGenerator[DbSession, None]:
+    """Yield an AsyncSession when DATABASE_ASYNC is enabled, otherwise a sync Session."""
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
 
-def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await run_in_threadpool(db.close)
+
+
+async def run_db(db: DbSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run sync ORM code against either session flavour without blocking the event loop.
+
+    AsyncSession executes `fn` through `run_sync` (a greenlet on the loop, no worker thread);
+    a plain Session falls back to Starlette's thread pool. `fn` receives a sync Session first,
+    so service code is written once and must not return lazily-loaded ORM state.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
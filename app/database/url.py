@@ -5,3 +5,14 @@ def normalize_database_url(raw_url: str) -> str:
     if raw_url.startswith("postgresql://") and "+psycopg" not in raw_url:
         return raw_url.replace("postgresql://", "postgresql+psycopg://", 1)
     return raw_url
+
+
+def to_async_database_url(raw_url: str) -> str:
+    """Map a normalized database URL onto its asyncio driver.
+
+    psycopg 3 serves both modes under the same dialect name, so only SQLite needs rewriting.
+    """
+    url = normalize_database_url(raw_url)
+    if url.startswith("sqlite://") or url.startswith("sqlite+pysqlite://"):
+        return "sqlite+aiosqlite://" + url.split("://", 1)[1]
+    return url
@@ -1,21 +1,20 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
 
 from app.api.service.auth_service import get_user_from_access_token
 from app.database.models.user import User
-from app.database.session import get_db
+from app.database.session import DbSession, get_db, run_db
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def require_current_user(
+async def require_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
 ) -> User:
     if not credentials or credentials.scheme.lower() != "bearer":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
     token = credentials.credentials
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing access token")
-    return get_user_from_access_token(db, token)
+    return await run_db(db, get_user_from_access_token, token)
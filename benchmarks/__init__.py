@@ -0,0 +1 @@
+"""Performance benchmarks for the Blyss API (run with `python -m benchmarks.<name>`)."""
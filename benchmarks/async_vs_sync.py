@@ -0,0 +1,96 @@
+"""Compare requests/sec of the sync (thread pool) and async (AsyncSession) database modes.
+
+Usage:
+    python -m benchmarks.async_vs_sync [--database-url URL] [--concurrency 64] [--duration 5]
+
+Without `--database-url` a throwaway SQLite file is used; point it at a migrated local
+Postgres to see the thread-pool effect the async mode is meant to remove.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.common import launch_app, login, percentile, prepare_schema, temp_sqlite_url
+
+SEED_FLOWERS = 10
+
+
+async def _seed(base_url: str) -> tuple[dict[str, str], int]:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        headers = await login(client, f"bench-{time.time_ns()}@example.com")
+        flower_id = 0
+        for index in range(SEED_FLOWERS):
+            created = await client.post("/api/v1/flowers", json={"title": f"Bench {index}"}, headers=headers)
+            created.raise_for_status()
+            flower_id = created.json()["id"]
+    return headers, flower_id
+
+
+async def _drive(base_url: str, path: str, headers: dict[str, str], concurrency: int, duration: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run(database_url: str, concurrency: int, duration: float) -> dict[str, dict[str, dict]]:
+    prepare_schema(database_url)
+    results: dict[str, dict[str, dict]] = {}
+    for mode, flag in (("sync", "false"), ("async", "true")):
+        with launch_app({"DATABASE_URL": database_url, "DATABASE_ASYNC": flag}) as base_url:
+            headers, flower_id = asyncio.run(_seed(base_url))
+            results[mode] = {}
+            for path in ("/api/v1/me", "/api/v1/flowers", f"/api/v1/flowers/{flower_id}"):
+                route = path.replace(str(flower_id), "{flower_id}")
+                results[mode][route] = asyncio.run(_drive(base_url, path, headers, concurrency, duration))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    results = run(args.database_url or temp_sqlite_url(), args.concurrency, args.duration)
+    print(f"{'route':<28}{'mode':<8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for route in results["sync"]:
+        for mode in ("sync", "async"):
+            row = results[mode][route]
+            print(
+                f"{route:<28}{mode:<8}{row['rps']:>10.1f}{row['p50_ms']:>10.2f}"
+                f"{row['p99_ms']:>10.2f}{row['errors']:>8}"
+            )
+        speedup = results["async"][route]["rps"] / max(results["sync"][route]["rps"], 1e-9)
+        print(f"{'':<28}{'async/sync':<18}{speedup:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
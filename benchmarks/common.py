@@ -0,0 +1,110 @@
+"""Helpers shared by the benchmark scripts: local app launch, schema setup and login."""
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import httpx
+from sqlalchemy import create_engine
+
+BENCH_ENV = {
+    "ENVIRONMENT": "local",
+    "RATE_LIMIT_AUTH_REQUESTS_PER_WINDOW": "1000000",
+    "AUTH_JWT_SECRET": "benchmark-jwt-secret-benchmark-jwt-secret",
+    "AUTH_OTP_SECRET": "benchmark-otp-secret-benchmark-otp-secret",
+    "RESEND_API_KEY": "",
+    "SQLALCHEMY_ECHO": "false",
+}
+
+
+def temp_sqlite_url() -> str:
+    return f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'blyss-bench.db')}"
+
+
+def prepare_schema(database_url: str) -> None:
+    """Create tables directly for SQLite; Postgres targets are expected to be migrated already."""
+    if not database_url.startswith("sqlite"):
+        return
+    from app.database import models  # noqa: F401
+    from app.database.base import Base
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def launch_app(env: dict[str, str], *, workers: int = 1) -> Iterator[str]:
+    """Run `app.main:app` under uvicorn in a subprocess and yield its base URL."""
+    port = free_port()
+    proc_env = {**os.environ, **BENCH_ENV, **env}
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=proc_env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited early with code {proc.returncode}")
+            try:
+                if httpx.get(f"{base_url}/api/v1/health", timeout=1).status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("uvicorn did not become healthy in time")
+            time.sleep(0.1)
+        yield base_url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+async def login(client: httpx.AsyncClient, email: str) -> dict[str, str]:
+    """Run the OTP flow (debug OTP is echoed outside production) and return auth headers."""
+    requested = await client.post("/api/v1/auth/request-otp", json={"email": email})
+    requested.raise_for_status()
+    verified = await client.post(
+        "/api/v1/auth/verify-otp", json={"email": email, "otp": requested.json()["debug_otp"]}
+    )
+    verified.raise_for_status()
+    return {"Authorization": f"Bearer {verified.json()['access_token']}"}
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
@@ -0,0 +1,82 @@
+import os
+import tempfile
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+os.environ["ENVIRONMENT"] = "local"
+os.environ["RATE_LIMIT_AUTH_REQUESTS_PER_WINDOW"] = "100"
+os.environ["AUTH_JWT_SECRET"] = "test-jwt-secret"
+os.environ["AUTH_OTP_SECRET"] = "test-otp-secret"
+
+from app.database.base import Base
+from app.database.models.flower import Flower, FlowerStatus
+from app.database.session import get_db
+from app.main import app
+
+
+def _build_async_test_client() -> tuple[TestClient, sessionmaker[Session]]:
+    # aiosqlite connections are loop-bound, so share state through a file rather than StaticPool.
+    db_path = os.path.join(tempfile.mkdtemp(), "blyss-async.db")
+    sync_engine = create_engine(f"sqlite+pysqlite:///{db_path}")
+    Base.metadata.create_all(bind=sync_engine)
+    session_local = sessionmaker(bind=sync_engine, autoflush=False, autocommit=False, class_=Session)
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    async_session_local = async_sessionmaker(bind=async_engine, autoflush=False, class_=AsyncSession)
+
+    async def override_get_db():
+        async with async_session_local() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app), session_local
+
+
+def _auth_headers(client: TestClient, email: str) -> dict[str, str]:
+    otp = client.post("/api/v1/auth/request-otp", json={"email": email}).json()["debug_otp"]
+    verify = client.post("/api/v1/auth/verify-otp", json={"email": email, "otp": otp})
+    assert verify.status_code == 200
+    return {"Authorization": f"Bearer {verify.json()['access_token']}"}
+
+
+def test_async_session_serves_auth_and_flower_routes() -> None:
+    client, session_local = _build_async_test_client()
+    headers = _auth_headers(client, "async@example.com")
+
+    me = client.get("/api/v1/me", headers=headers)
+    assert me.status_code == 200
+    assert me.json()["email"] == "async@example.com"
+
+    created = client.post("/api/v1/flowers", json={"title": "Async Bloom"}, headers=headers)
+    assert created.status_code == 201
+    flower_id = created.json()["id"]
+
+    watered = client.post(
+        f"/api/v1/flowers/{flower_id}/water",
+        json={"message": "Watered without a worker thread"},
+        headers=headers,
+    )
+    assert watered.status_code == 200
+    assert watered.json()["flower"]["water_count"] == 1
+
+    listed = client.get("/api/v1/flowers", headers=headers)
+    assert [item["id"] for item in listed.json()["items"]] == [flower_id]
+
+    with session_local() as db:
+        flower = db.get(Flower, flower_id)
+        assert flower is not None
+        flower.status = FlowerStatus.ready.value
+        flower.ready_at = datetime.now(UTC)
+        db.commit()
+
+    send = client.post(f"/api/v1/flowers/{flower_id}/send", json={}, headers=headers)
+    assert send.status_code == 200
+
+    opened = client.get(f"/api/v1/flowers/open/{send.json()['share_token']}")
+    assert opened.status_code == 200
+    assert [drop["message"] for drop in opened.json()["drops"]] == ["Watered without a worker thread"]
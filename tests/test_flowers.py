@@ -155,3 +155,45 @@ def test_get_flower_detail_for_owner() -> None:
     assert payload["delivery_mode"] is None
     assert payload["recipient_name"] is None
     assert payload["recipient_contact"] is None
+
+
+def test_list_flowers_keyset_pagination_and_status_filter() -> None:
+    client, session_local = _build_test_client()
+    headers = _auth_headers(client, "paginate@example.com")
+
+    created_ids = []
+    for index in range(5):
+        created = client.post("/api/v1/flowers", json={"title": f"Bloom {index}"}, headers=headers)
+        assert created.status_code == 201
+        created_ids.append(created.json()["id"])
+
+    with session_local() as db:
+        flower = db.get(Flower, created_ids[1])
+        assert flower is not None
+        flower.status = FlowerStatus.ready.value
+        db.commit()
+
+    seen: list[int] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        page = client.get("/api/v1/flowers", params=params, headers=headers)
+        assert page.status_code == 200
+        seen.extend(item["id"] for item in page.json()["items"])
+        cursor = page.json()["next_cursor"]
+        pages += 1
+        if cursor is None:
+            break
+
+    # Flowers created within the same second still page without gaps or repeats via the id tiebreak.
+    assert seen == list(reversed(created_ids))
+    assert pages == 3
+
+    ready = client.get("/api/v1/flowers", params={"status": "ready"}, headers=headers)
+    assert [item["id"] for item in ready.json()["items"]] == [created_ids[1]]
+    assert ready.json()["next_cursor"] is None
+
+    invalid = client.get("/api/v1/flowers", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert invalid.status_code == 400
+    assert invalid.json()["detail"] == "Invalid cursor"